@@ -0,0 +1,70 @@
+"""Sweep torch thread settings under the current CPU quota and report the fastest.
+
+Only torch intra-op and inter-op threads are swept; decode and I/O pool sizes
+are left to the resource planner.
+
+Run inside the worker container (or with the same cgroup limits) so the
+results reflect the quota the deployment actually gets:
+
+    python -m benchmarks.thread_sweep --iterations 10
+"""
+
+import argparse
+import itertools
+import math
+import subprocess
+import sys
+
+from src.infrastructure.resource_planner import plan_resources, read_resource_limits
+
+
+def _run_trial(inference_threads: int, interop_threads: int, iterations: int, size: int) -> float:
+    """Time RFDETR inference in a fresh process, since interop threads can only be set once"""
+    code = f"""
+import time, statistics, torch
+from PIL import Image
+torch.set_num_threads({inference_threads})
+torch.set_num_interop_threads({interop_threads})
+from src.infrastructure.models.rfdetr_model import RFDETRModel
+model = RFDETRModel()
+image = Image.new("RGB", ({size}, {size}), (127, 127, 127))
+model.predict(image)
+timings = []
+for _ in range({iterations}):
+    start = time.perf_counter()
+    model.predict(image)
+    timings.append((time.perf_counter() - start) * 1000)
+print(statistics.median(timings))
+"""
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--image-size", type=int, default=640)
+    args = parser.parse_args()
+
+    limits = read_resource_limits()
+    planned = plan_resources(limits)
+    max_threads = max(1, math.ceil(limits.cpu_quota)) + 1
+
+    print(f"cpu_quota={limits.cpu_quota:.2f} memory_limit={limits.memory_limit_bytes}")
+    print(f"planned: inference_threads={planned.inference_threads} interop_threads={planned.interop_threads}")
+    print(f"{'inference':>9} {'interop':>7} {'median_ms':>10}")
+
+    results = {}
+    for inference_threads, interop_threads in itertools.product(range(1, max_threads + 1), (1, 2)):
+        median_ms = _run_trial(inference_threads, interop_threads, args.iterations, args.image_size)
+        results[(inference_threads, interop_threads)] = median_ms
+        print(f"{inference_threads:>9} {interop_threads:>7} {median_ms:>10.1f}")
+
+    best = min(results, key=results.get)
+    print(f"best: INFERENCE_THREADS={best[0]} INTEROP_THREADS={best[1]} ({results[best]:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
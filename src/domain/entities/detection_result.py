@@ -31,4 +31,12 @@ class ProcessingResult:
     task_id: UUID
     detections: List[Detection]
     processed_at: datetime
-    processing_time_ms: int
\ No newline at end of file
+    processing_time_ms: int
+
+
+@dataclass
+class PartialResult:
+    task_id: UUID
+    detections: List[Detection]
+    chunk_index: int
+    total_chunks: int
@@ -1,27 +1,39 @@
 """Serialization utilities for domain entities"""
 
 from typing import Dict, Any
-from .detection_result import ProcessingResult
+from .detection_result import Detection, PartialResult, ProcessingResult
+
+
+def serialize_detection(detection: Detection) -> Dict[str, Any]:
+    """Convert Detection to JSON-serializable dict"""
+    return {
+        "class_id": detection.class_id,
+        "class_name": detection.class_name,
+        "confidence": detection.confidence,
+        "bbox": {
+            "x1": detection.bbox.x1,
+            "y1": detection.bbox.y1,
+            "x2": detection.bbox.x2,
+            "y2": detection.bbox.y2,
+        },
+    }
 
 
 def serialize_processing_result(result: ProcessingResult) -> Dict[str, Any]:
     """Convert ProcessingResult to JSON-serializable dict"""
     return {
         "task_id": str(result.task_id),
-        "detections": [
-            {
-                "class_id": d.class_id,
-                "class_name": d.class_name,
-                "confidence": d.confidence,
-                "bbox": {
-                    "x1": d.bbox.x1,
-                    "y1": d.bbox.y1,
-                    "x2": d.bbox.x2,
-                    "y2": d.bbox.y2,
-                },
-            }
-            for d in result.detections
-        ],
+        "detections": [serialize_detection(d) for d in result.detections],
         "processed_at": result.processed_at.isoformat(),
         "processing_time_ms": result.processing_time_ms,
     }
+
+
+def serialize_partial_result(partial: PartialResult) -> Dict[str, Any]:
+    """Convert PartialResult to JSON-serializable dict"""
+    return {
+        "task_id": str(partial.task_id),
+        "detections": [serialize_detection(d) for d in partial.detections],
+        "chunk_index": partial.chunk_index,
+        "total_chunks": partial.total_chunks,
+    }
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Tuple
 from PIL import Image
 
 
@@ -7,6 +8,16 @@ class ImageRepository(ABC):
     async def retrieve_image(self, key: str) -> Image.Image:
         pass
 
+    @abstractmethod
+    async def retrieve_image_bytes(self, key: str) -> Tuple[bytes, str]:
+        """Return the raw image bytes and the image id of the downloaded version"""
+        pass
+
+    @abstractmethod
+    async def get_image_id(self, key: str) -> str:
+        """Return an id that changes whenever the stored image changes, without downloading it"""
+        pass
+
     @abstractmethod
     async def store_results(self, key: str, data: dict) -> None:
         pass
\ No newline at end of file
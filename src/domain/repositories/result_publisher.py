@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from ..entities.detection_result import PartialResult, ProcessingResult
+
+
+class ResultPublisher(ABC):
+    @abstractmethod
+    async def publish_partial(self, partial: PartialResult) -> None:
+        pass
+
+    @abstractmethod
+    async def publish_final(self, result: ProcessingResult) -> None:
+        pass
\ No newline at end of file
@@ -7,9 +7,19 @@ class WorkerConfig:
     gcp_project_id: str
     gcs_bucket: str
     pubsub_subscription: str
+    pubsub_results_topic: str
+    results_publish_timeout: int
     api_service_url: str
     confidence_threshold: float
     callback_timeout: int
+    inference_threads: int
+    interop_threads: int
+    io_workers: int
+    pin_inference_cpus: bool
+    tile_size: int
+    tile_overlap: int
+    image_cache_dir: str
+    image_cache_max_bytes: int
 
 
 def load_config() -> WorkerConfig:
@@ -17,7 +27,17 @@ def load_config() -> WorkerConfig:
         gcp_project_id=os.getenv("GCP_PROJECT_ID", "your-gcp-project"),
         gcs_bucket=os.getenv("GCS_BUCKET", "object-detection-images"),
         pubsub_subscription=os.getenv("PUBSUB_SUBSCRIPTION", "detection-workers"),
+        pubsub_results_topic=os.getenv("PUBSUB_RESULTS_TOPIC", ""),
+        results_publish_timeout=int(os.getenv("RESULTS_PUBLISH_TIMEOUT", "30")),
         api_service_url=os.getenv("API_SERVICE_URL", "http://object-detection-api"),
         confidence_threshold=float(os.getenv("CONFIDENCE_THRESHOLD", "0.5")),
         callback_timeout=int(os.getenv("CALLBACK_TIMEOUT", "30")),
+        inference_threads=int(os.getenv("INFERENCE_THREADS", "0")),
+        interop_threads=int(os.getenv("INTEROP_THREADS", "0")),
+        io_workers=int(os.getenv("IO_WORKERS", "0")),
+        pin_inference_cpus=os.getenv("PIN_INFERENCE_CPUS", "false").lower() == "true",
+        tile_size=int(os.getenv("TILE_SIZE", "0")),
+        tile_overlap=int(os.getenv("TILE_OVERLAP", "64")),
+        image_cache_dir=os.getenv("IMAGE_CACHE_DIR", ""),
+        image_cache_max_bytes=int(os.getenv("IMAGE_CACHE_MAX_BYTES", str(1024 * 1024 * 1024))),
     )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Sequence
 from PIL import Image
 import supervision as sv
 from rfdetr import RFDETRBase
@@ -6,16 +6,23 @@ from rfdetr.util.coco_classes import COCO_CLASSES
 
 from src.domain.entities.detection_result import Detection, BoundingBox
 from src.domain.repositories.detection_model import DetectionModel
+from src.infrastructure.resource_planner import pinned_to
 
 
 class RFDETRModel(DetectionModel):
-    def __init__(self, confidence_threshold: float = 0.5):
+    def __init__(
+        self,
+        confidence_threshold: float = 0.5,
+        inference_cpus: Optional[Sequence[int]] = None,
+    ):
         self._model = RFDETRBase()
         self._coco_classes = COCO_CLASSES
         self._confidence_threshold = confidence_threshold
+        self._inference_cpus = inference_cpus
 
     def predict(self, image: Image.Image) -> List[Detection]:
-        detections_sv = self._model.predict(image)
+        with pinned_to(self._inference_cpus):
+            detections_sv = self._model.predict(image)
         
         detections = []
         for class_id, confidence, bbox in zip(
@@ -0,0 +1,224 @@
+import asyncio
+import fcntl
+import hashlib
+import io
+import logging
+import mmap
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+from PIL import Image
+
+from src.domain.repositories.image_repository import ImageRepository
+
+logger = logging.getLogger(__name__)
+
+_TMP_PREFIX = ".tmp-"
+_LOCK_FILE = ".evict.lock"
+# Temp files older than this were left behind by a crashed writer
+_STALE_TMP_SECONDS = 3600
+
+
+class CachedImageRepository(ImageRepository):
+    """Node-local, size-bounded LRU disk cache in front of another ImageRepository.
+
+    Entries live at ``<hash(key)>/<hash(image id)>``, where the image id comes
+    from the wrapped repository (bucket, object and generation for GCS). A
+    cheap metadata check decides whether a cached copy is still current; keys
+    with no directory were never cached and go straight to the download.
+    Writes are atomic renames under a shared lock and eviction takes the lock
+    exclusively, so several worker processes can share one cache directory.
+    """
+
+    def __init__(
+        self,
+        repository: ImageRepository,
+        cache_dir: str,
+        max_bytes: int,
+        decode_workers: int = 1,
+    ):
+        self._repository = repository
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        # Disk reads, writes and decoding stay off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=decode_workers, thread_name_prefix="image-cache")
+        os.makedirs(cache_dir, exist_ok=True)
+
+    async def retrieve_image(self, key: str) -> Image.Image:
+        loop = asyncio.get_running_loop()
+        image_id = await self._lookup(key)
+        if image_id is not None:
+            image = await loop.run_in_executor(self._executor, self._read_cached_image, image_id, key)
+            if image is not None:
+                return image
+
+        image_data, _ = await self._download(key)
+        try:
+            return await loop.run_in_executor(self._executor, self._decode, image_data)
+        except Exception as e:
+            raise RuntimeError(f"Failed to retrieve image: {e}")
+
+    async def retrieve_image_bytes(self, key: str) -> Tuple[bytes, str]:
+        image_id = await self._lookup(key)
+        if image_id is not None:
+            loop = asyncio.get_running_loop()
+            image_data = await loop.run_in_executor(self._executor, self._read_cached_bytes, image_id, key)
+            if image_data is not None:
+                return image_data, image_id
+
+        return await self._download(key)
+
+    async def get_image_id(self, key: str) -> str:
+        return await self._repository.get_image_id(key)
+
+    async def store_results(self, key: str, data: dict) -> None:
+        await self._repository.store_results(key, data)
+
+    async def _lookup(self, key: str) -> Optional[str]:
+        """Return the current image id if a cached copy of it exists"""
+        # A metadata round trip only pays off when there is a cached copy to validate
+        if not self._has_entries(key):
+            return None
+        image_id = await self._repository.get_image_id(key)
+        return image_id if os.path.exists(self._entry_path(key, image_id)) else None
+
+    async def _download(self, key: str) -> Tuple[bytes, str]:
+        image_data, image_id = await self._repository.retrieve_image_bytes(key)
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, self._write_cached, key, image_id, image_data)
+        except OSError as e:
+            # A full or unwritable cache must not fail the task
+            logger.warning(f"Failed to cache image {key}: {e}")
+        return image_data, image_id
+
+    def _key_dir(self, key: str) -> str:
+        return os.path.join(self._cache_dir, hashlib.sha256(key.encode()).hexdigest())
+
+    def _entry_path(self, key: str, image_id: str) -> str:
+        return os.path.join(self._key_dir(key), hashlib.sha256(image_id.encode()).hexdigest())
+
+    def _has_entries(self, key: str) -> bool:
+        try:
+            with os.scandir(self._key_dir(key)) as entries:
+                return any(True for _ in entries)
+        except FileNotFoundError:
+            return False
+
+    def _read_cached_image(self, image_id: str, key: str) -> Optional[Image.Image]:
+        path = self._entry_path(key, image_id)
+        try:
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    image = Image.open(mapped).convert('RGB')
+        except FileNotFoundError:
+            # Evicted by another process between lookup and open
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+        self._touch(path)
+        return image
+
+    def _read_cached_bytes(self, image_id: str, key: str) -> Optional[bytes]:
+        path = self._entry_path(key, image_id)
+        try:
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    image_data = mapped[:]
+        except FileNotFoundError:
+            return None
+
+        self._touch(path)
+        return image_data
+
+    def _touch(self, path: str) -> None:
+        try:
+            # Bump mtime so eviction sees this entry as recently used
+            os.utime(path)
+        except OSError:
+            # Evicted since the read; the data already read is still good
+            pass
+
+    def _write_cached(self, key: str, image_id: str, image_data: bytes) -> None:
+        if len(image_data) > self._max_bytes:
+            return
+
+        entry_path = self._entry_path(key, image_id)
+        tmp_path = os.path.join(self._cache_dir, f"{_TMP_PREFIX}{os.getpid()}-{uuid.uuid4().hex}")
+        with open(os.path.join(self._cache_dir, _LOCK_FILE), 'a') as lock:
+            # Shared with other writers; keeps eviction from removing the key
+            # directory between makedirs and the rename into it
+            fcntl.flock(lock, fcntl.LOCK_SH)
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(image_data)
+                os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+                # Readers only ever see complete files
+                os.replace(tmp_path, entry_path)
+            finally:
+                self._remove(tmp_path)
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits in max_bytes"""
+        with open(os.path.join(self._cache_dir, _LOCK_FILE), 'a') as lock:
+            # Blocking, so a pass always runs after this process's latest write
+            fcntl.flock(lock, fcntl.LOCK_EX)
+
+            entries = []
+            total_bytes = 0
+            now = time.time()
+            for entry in os.scandir(self._cache_dir):
+                if entry.name.startswith('.'):
+                    if entry.name.startswith(_TMP_PREFIX):
+                        self._remove_stale_tmp(entry, now)
+                    continue
+                if not entry.is_dir():
+                    continue
+                for cached in os.scandir(entry.path):
+                    try:
+                        stat = cached.stat()
+                    except FileNotFoundError:
+                        # Unreadable entry discarded by a reader
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, cached.path))
+                    total_bytes += stat.st_size
+
+            for _, size, path in sorted(entries):
+                if total_bytes <= self._max_bytes:
+                    break
+                self._remove(path)
+                total_bytes -= size
+                try:
+                    # Drop the key directory once its last version is gone
+                    os.rmdir(os.path.dirname(path))
+                except OSError:
+                    pass
+
+    def _remove_stale_tmp(self, entry: os.DirEntry, now: float) -> None:
+        try:
+            if now - entry.stat().st_mtime > _STALE_TMP_SECONDS:
+                self._remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _decode(image_data: bytes) -> Image.Image:
+        return Image.open(io.BytesIO(image_data)).convert('RGB')
@@ -1,5 +1,8 @@
+import asyncio
 import json
 import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
 from PIL import Image
 from google.cloud import storage
 from google.cloud.exceptions import NotFound
@@ -8,27 +11,71 @@ from src.domain.repositories.image_repository import ImageRepository
 
 
 class GCSImageRepository(ImageRepository):
-    def __init__(self, client: storage.Client, bucket_name: str):
+    def __init__(
+        self,
+        client: storage.Client,
+        bucket_name: str,
+        io_workers: int = 4,
+        decode_workers: int = 1,
+    ):
         self._client = client
         self._bucket_name = bucket_name
         self._bucket = self._client.bucket(bucket_name)
+        # Blocking GCS calls and PIL decoding run on bounded pools sized by the resource plan
+        self._io_executor = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="gcs-io")
+        self._decode_executor = ThreadPoolExecutor(max_workers=decode_workers, thread_name_prefix="decode")
 
     async def retrieve_image(self, key: str) -> Image.Image:
+        image_data, _ = await self.retrieve_image_bytes(key)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._decode_executor, self._decode, image_data)
+        except Exception as e:
+            raise RuntimeError(f"Failed to retrieve image: {e}")
+
+    async def retrieve_image_bytes(self, key: str) -> Tuple[bytes, str]:
+        loop = asyncio.get_running_loop()
         try:
             blob = self._bucket.blob(key)
-            image_data = blob.download_as_bytes()
-            return Image.open(io.BytesIO(image_data)).convert('RGB')
+            image_data = await loop.run_in_executor(self._io_executor, blob.download_as_bytes)
+            # The download response headers populate blob.generation for the bytes we got
+            return image_data, self._image_id(key, blob.generation)
         except NotFound:
             raise RuntimeError(f"Image not found: {key}")
         except Exception as e:
             raise RuntimeError(f"Failed to retrieve image: {e}")
 
+    async def get_image_id(self, key: str) -> str:
+        loop = asyncio.get_running_loop()
+        try:
+            blob = self._bucket.blob(key)
+            # Metadata-only GET; far cheaper than re-downloading the object
+            await loop.run_in_executor(
+                self._io_executor, lambda: blob.reload(projection="noAcl")
+            )
+            return self._image_id(key, blob.generation)
+        except NotFound:
+            raise RuntimeError(f"Image not found: {key}")
+        except Exception as e:
+            raise RuntimeError(f"Failed to retrieve image metadata: {e}")
+
     async def store_results(self, key: str, data: dict) -> None:
+        loop = asyncio.get_running_loop()
         try:
             blob = self._bucket.blob(key)
-            blob.upload_from_string(
-                json.dumps(data, indent=2),
-                content_type='application/json'
+            await loop.run_in_executor(
+                self._io_executor,
+                lambda: blob.upload_from_string(
+                    json.dumps(data, indent=2),
+                    content_type='application/json'
+                ),
             )
         except Exception as e:
-            raise RuntimeError(f"Failed to store results: {e}")
\ No newline at end of file
+            raise RuntimeError(f"Failed to store results: {e}")
+
+    def _image_id(self, key: str, generation: int) -> str:
+        return f"gs://{self._bucket_name}/{key}#{generation}"
+
+    @staticmethod
+    def _decode(image_data: bytes) -> Image.Image:
+        return Image.open(io.BytesIO(image_data)).convert('RGB')
\ No newline at end of file
@@ -0,0 +1,54 @@
+import io
+import json
+import os
+from typing import Tuple
+from PIL import Image
+
+from src.domain.repositories.image_repository import ImageRepository
+
+
+class LocalImageRepository(ImageRepository):
+    """Filesystem-backed repository for local runs and tests"""
+
+    def __init__(self, root_dir: str):
+        self._root_dir = root_dir
+
+    async def retrieve_image(self, key: str) -> Image.Image:
+        image_data, _ = await self.retrieve_image_bytes(key)
+        try:
+            return Image.open(io.BytesIO(image_data)).convert('RGB')
+        except Exception as e:
+            raise RuntimeError(f"Failed to retrieve image: {e}")
+
+    async def retrieve_image_bytes(self, key: str) -> Tuple[bytes, str]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                return f.read(), self._image_id(path, os.fstat(f.fileno()))
+        except FileNotFoundError:
+            raise RuntimeError(f"Image not found: {key}")
+        except Exception as e:
+            raise RuntimeError(f"Failed to retrieve image: {e}")
+
+    async def get_image_id(self, key: str) -> str:
+        path = self._path(key)
+        try:
+            return self._image_id(path, os.stat(path))
+        except FileNotFoundError:
+            raise RuntimeError(f"Image not found: {key}")
+
+    async def store_results(self, key: str, data: dict) -> None:
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(data, f, indent=2)
+        except Exception as e:
+            raise RuntimeError(f"Failed to store results: {e}")
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._root_dir, key)
+
+    @staticmethod
+    def _image_id(path: str, stat: os.stat_result) -> str:
+        return f"file://{os.path.abspath(path)}#{stat.st_mtime_ns}-{stat.st_size}"
\ No newline at end of file
@@ -1,5 +1,6 @@
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 from uuid import UUID
 
@@ -11,9 +12,17 @@ logger = logging.getLogger(__name__)
 
 
 class PubSubTaskProcessor:
-    def __init__(self, project_id: str, subscription_name: str = "detection-workers"):
+    def __init__(
+        self,
+        project_id: str,
+        subscription_name: str = "detection-workers",
+        max_messages: int = 1,
+        max_bytes: int = 10 * 1024 * 1024,
+    ):
         self._project_id = project_id
         self._subscription_name = subscription_name
+        self._max_messages = max_messages
+        self._max_bytes = max_bytes
         self._subscriber = pubsub_v1.SubscriberClient()
         self._subscription_path = self._subscriber.subscription_path(project_id, subscription_name)
         
@@ -21,7 +30,17 @@ class PubSubTaskProcessor:
         """Start consuming messages from Pub/Sub subscription"""
         logger.info(f"Starting to consume messages from {self._subscription_path}")
         
-        flow_control = pubsub_v1.types.FlowControl(max_messages=1)  # Process one task at a time
+        flow_control = pubsub_v1.types.FlowControl(
+            max_messages=self._max_messages,
+            max_bytes=self._max_bytes,
+        )
+        # Match callback threads to in-flight messages instead of the client's default pool of 10
+        scheduler = pubsub_v1.subscriber.scheduler.ThreadScheduler(
+            executor=ThreadPoolExecutor(
+                max_workers=self._max_messages,
+                thread_name_prefix="pubsub-callback",
+            )
+        )
         
         def message_handler(message):
             try:
@@ -50,7 +69,8 @@ class PubSubTaskProcessor:
         streaming_pull_future = self._subscriber.subscribe(
             self._subscription_path,
             callback=message_handler,
-            flow_control=flow_control
+            flow_control=flow_control,
+            scheduler=scheduler,
         )
         
         logger.info(f"Listening for messages on {self._subscription_path}...")
@@ -0,0 +1,199 @@
+"""Size worker thread pools to the container's cgroup CPU and memory limits"""
+
+import logging
+import math
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CGROUP_ROOT = "/sys/fs/cgroup"
+
+# Rough per-task working set (downloaded bytes, decoded RGB image, activations)
+# and the resident footprint of the loaded RFDETR model, used to cap in-flight tasks.
+TASK_MEMORY_BYTES = 512 * 1024 * 1024
+MODEL_MEMORY_BYTES = 1536 * 1024 * 1024
+
+# cgroup v1 reports "unlimited" as a huge page-aligned number rather than "max".
+_CGROUP_V1_UNLIMITED = 1 << 60
+
+
+@dataclass
+class ResourceLimits:
+    cpu_quota: float
+    memory_limit_bytes: Optional[int]
+    available_cpus: Tuple[int, ...]
+    # Quota as read from the cgroup; None when the container has no CPU limit
+    cgroup_cpu_quota: Optional[float] = None
+
+
+@dataclass
+class ResourcePlan:
+    inference_threads: int
+    interop_threads: int
+    decode_workers: int
+    io_workers: int
+    max_messages: int
+    max_bytes: int
+    inference_cpus: Optional[Tuple[int, ...]] = None
+
+
+def _read_file(path: str) -> Optional[str]:
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _available_cpus() -> Tuple[int, ...]:
+    if hasattr(os, "sched_getaffinity"):
+        return tuple(sorted(os.sched_getaffinity(0)))
+    return tuple(range(os.cpu_count() or 1))
+
+
+def _read_cpu_quota(root: str) -> Optional[float]:
+    # cgroup v2: "<quota> <period>" or "max <period>"
+    cpu_max = _read_file(os.path.join(root, "cpu.max"))
+    if cpu_max:
+        quota, _, period = cpu_max.partition(" ")
+        if quota != "max" and period:
+            return int(quota) / int(period)
+        return None
+
+    # cgroup v1: quota of -1 means unlimited
+    quota = _read_file(os.path.join(root, "cpu", "cpu.cfs_quota_us"))
+    period = _read_file(os.path.join(root, "cpu", "cpu.cfs_period_us"))
+    if quota and period and int(quota) > 0:
+        return int(quota) / int(period)
+    return None
+
+
+def _read_memory_limit(root: str) -> Optional[int]:
+    memory_max = _read_file(os.path.join(root, "memory.max"))
+    if memory_max:
+        return None if memory_max == "max" else int(memory_max)
+
+    limit = _read_file(os.path.join(root, "memory", "memory.limit_in_bytes"))
+    if limit and int(limit) < _CGROUP_V1_UNLIMITED:
+        return int(limit)
+    return None
+
+
+def read_resource_limits(cgroup_root: str = DEFAULT_CGROUP_ROOT) -> ResourceLimits:
+    """Read CPU quota and memory limit from cgroup v2 or v1, falling back to the host"""
+    available_cpus = _available_cpus()
+    cgroup_cpu_quota = _read_cpu_quota(cgroup_root)
+    cpu_quota = float(len(available_cpus))
+    if cgroup_cpu_quota is not None:
+        cpu_quota = min(cgroup_cpu_quota, cpu_quota)
+
+    return ResourceLimits(
+        cpu_quota=cpu_quota,
+        memory_limit_bytes=_read_memory_limit(cgroup_root),
+        available_cpus=available_cpus,
+        cgroup_cpu_quota=cgroup_cpu_quota,
+    )
+
+
+def plan_resources(
+    limits: ResourceLimits,
+    inference_threads: int = 0,
+    interop_threads: int = 0,
+    io_workers: int = 0,
+    pin_inference_cpus: bool = False,
+) -> ResourcePlan:
+    """Derive thread pool sizes and flow control that fit within the given limits.
+
+    Non-zero ``inference_threads`` / ``interop_threads`` / ``io_workers``
+    override the derived values.
+    """
+    cpus = max(1, math.floor(limits.cpu_quota))
+
+    if not inference_threads:
+        # Leave one core for Pub/Sub, decode and I/O once there are enough to spare
+        inference_threads = cpus if cpus <= 2 else cpus - 1
+    if not interop_threads:
+        interop_threads = 1 if cpus <= 2 else 2
+    decode_workers = 1 if cpus <= 4 else 2
+    if not io_workers:
+        # I/O threads mostly wait on the network, so they can oversubscribe the quota
+        io_workers = min(8, 2 * cpus)
+
+    max_messages = max(1, cpus // inference_threads)
+    if limits.memory_limit_bytes is not None:
+        task_budget = (limits.memory_limit_bytes - MODEL_MEMORY_BYTES) // TASK_MEMORY_BYTES
+        max_messages = max(1, min(max_messages, task_budget))
+
+    inference_cpus = None
+    if pin_inference_cpus:
+        # Only an exclusive cpuset (Guaranteed QoS with the static CPU manager) is safe
+        # to pin within; otherwise the mask is shared with every pod on the node.
+        if limits.cgroup_cpu_quota is None:
+            logger.warning("Not pinning inference: no CPU quota, so the cpuset is not exclusive")
+        elif len(limits.available_cpus) <= math.ceil(limits.cgroup_cpu_quota):
+            inference_cpus = limits.available_cpus[:inference_threads]
+        else:
+            logger.warning(
+                f"Not pinning inference: {len(limits.available_cpus)} CPUs in affinity mask "
+                f"exceed CPU quota {limits.cpu_quota:.2f}, so the cpuset is not exclusive"
+            )
+
+    return ResourcePlan(
+        inference_threads=inference_threads,
+        interop_threads=interop_threads,
+        decode_workers=decode_workers,
+        io_workers=io_workers,
+        max_messages=max_messages,
+        max_bytes=max_messages * 10 * 1024 * 1024,
+        inference_cpus=inference_cpus,
+    )
+
+
+def apply_resource_plan(plan: ResourcePlan) -> None:
+    """Configure torch threading and log the chosen plan.
+
+    Must run before any inference so torch's thread pools are created with the
+    planned sizes.
+    """
+    import torch
+
+    torch.set_num_threads(plan.inference_threads)
+    try:
+        torch.set_num_interop_threads(plan.interop_threads)
+    except RuntimeError as e:
+        # Interop pool size is fixed once any parallel work has started
+        logger.warning(f"Could not set torch interop threads: {e}")
+
+    logger.info(
+        "Resource plan: "
+        f"inference_threads={plan.inference_threads} "
+        f"interop_threads={plan.interop_threads} "
+        f"decode_workers={plan.decode_workers} "
+        f"io_workers={plan.io_workers} "
+        f"max_messages={plan.max_messages} "
+        f"max_bytes={plan.max_bytes} "
+        f"inference_cpus={list(plan.inference_cpus) if plan.inference_cpus else 'unpinned'}"
+    )
+
+
+@contextmanager
+def pinned_to(cpus: Optional[Sequence[int]]) -> Iterator[None]:
+    """Pin the calling thread to ``cpus`` for the duration of the block.
+
+    Threads started inside the block (e.g. torch's intra-op pool on first use)
+    inherit the affinity; the calling thread is restored on exit so Pub/Sub and
+    I/O threads it spawns later stay unpinned.
+    """
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, cpus)
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, previous)
@@ -0,0 +1,53 @@
+import asyncio
+import json
+import logging
+
+from google.cloud import pubsub_v1
+
+from src.domain.entities.detection_result import PartialResult, ProcessingResult
+from src.domain.entities.serializers import serialize_partial_result, serialize_processing_result
+from src.domain.repositories.result_publisher import ResultPublisher
+
+logger = logging.getLogger(__name__)
+
+
+class PubSubResultPublisher(ResultPublisher):
+    def __init__(self, project_id: str, topic_name: str, timeout: int = 30):
+        self._publisher = pubsub_v1.PublisherClient()
+        self._topic_path = self._publisher.topic_path(project_id, topic_name)
+        self._timeout = timeout
+
+    async def publish_partial(self, partial: PartialResult) -> None:
+        """Publish detections for one finished tile without waiting for the ack"""
+        try:
+            future = self._publish(serialize_partial_result(partial), str(partial.task_id), "partial")
+            future.add_done_callback(lambda f: self._log_failure(f, partial.task_id))
+        except Exception as e:
+            logger.error(f"Partial result publish failed for task {partial.task_id}: {e}")
+
+    async def publish_final(self, result: ProcessingResult) -> None:
+        """Publish the merged result and wait until Pub/Sub accepts it"""
+        payload = {
+            "detection_count": len(result.detections),
+            **serialize_processing_result(result),
+        }
+        try:
+            future = self._publish(payload, str(result.task_id), "final")
+            # Publish futures are concurrent.futures.Future, so wait without borrowing a thread
+            await asyncio.wait_for(asyncio.wrap_future(future), self._timeout)
+            logger.info(f"Published final result for task {result.task_id}")
+        except Exception as e:
+            logger.error(f"Result publish failed for task {result.task_id}: {e}")
+
+    def _publish(self, payload: dict, task_id: str, message_type: str):
+        return self._publisher.publish(
+            self._topic_path,
+            json.dumps(payload).encode("utf-8"),
+            task_id=task_id,
+            type=message_type,
+        )
+
+    @staticmethod
+    def _log_failure(future, task_id) -> None:
+        if future.exception() is not None:
+            logger.error(f"Partial result publish failed for task {task_id}: {future.exception()}")
@@ -1,12 +1,22 @@
 import logging
 import time
 from datetime import datetime, UTC
+from typing import List, Optional
 
-from src.domain.entities.detection_result import ProcessingTask, ProcessingResult
+from PIL import Image
+
+from src.domain.entities.detection_result import (
+    Detection,
+    PartialResult,
+    ProcessingTask,
+    ProcessingResult,
+)
 from src.domain.entities.serializers import serialize_processing_result
 from src.domain.repositories.detection_model import DetectionModel
 from src.domain.repositories.image_repository import ImageRepository
 from src.domain.repositories.callback_service import CallbackService
+from src.domain.repositories.result_publisher import ResultPublisher
+from src.infrastructure.services.tiling import compute_tiles, merge_detections, offset_detections
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +29,21 @@ class TaskProcessor:
         detection_model: DetectionModel,
         image_repository: ImageRepository,
         callback_service: CallbackService,
+        result_publisher: Optional[ResultPublisher] = None,
+        tile_size: int = 0,
+        tile_overlap: int = 0,
     ):
+        if tile_size and not 0 <= tile_overlap < tile_size:
+            raise ValueError(
+                f"Tile overlap must be in [0, tile_size): got overlap={tile_overlap}, tile_size={tile_size}"
+            )
+        
         self._model = detection_model
         self._image_repo = image_repository
         self._callback_service = callback_service
+        self._result_publisher = result_publisher
+        self._tile_size = tile_size
+        self._tile_overlap = tile_overlap
 
     async def process_task(self, task: ProcessingTask) -> ProcessingResult:
         """Process a detection task"""
@@ -31,7 +52,10 @@ class TaskProcessor:
         try:
             # Process image
             image = await self._image_repo.retrieve_image(task.image_path)
-            detections = self._model.predict(image)
+            if self._tile_size:
+                detections = await self._predict_tiled(task, image)
+            else:
+                detections = self._model.predict(image)
             
             processing_time_ms = int((time.time() - start_time) * 1000)
             
@@ -48,9 +72,35 @@ class TaskProcessor:
             
             await self._image_repo.store_results(results_key, results_data)
             await self._callback_service.send_callback(result)
+            if self._result_publisher:
+                await self._result_publisher.publish_final(result)
             
             return result
             
         except Exception as e:
             logger.error(f"Task {task.task_id} failed: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    async def _predict_tiled(self, task: ProcessingTask, image: Image.Image) -> List[Detection]:
+        """Run detection tile by tile, streaming each tile's detections as it finishes"""
+        tiles = compute_tiles(image.width, image.height, self._tile_size, self._tile_overlap)
+        
+        tile_results = []
+        for index, (left, top, right, bottom) in enumerate(tiles):
+            tile_detections = offset_detections(
+                self._model.predict(image.crop((left, top, right, bottom))),
+                left,
+                top,
+            )
+            tile_results.append(tile_detections)
+            
+            if self._result_publisher:
+                await self._result_publisher.publish_partial(PartialResult(
+                    task_id=task.task_id,
+                    detections=tile_detections,
+                    chunk_index=index,
+                    total_chunks=len(tiles),
+                ))
+        
+        # Overlapping tiles see the same object more than once
+        return merge_detections(tile_results) if len(tiles) > 1 else tile_results[0]
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""Split large images into overlapping tiles and merge per-tile detections"""
+
+import math
+from typing import List, Sequence, Set, Tuple
+
+from src.domain.entities.detection_result import BoundingBox, Detection
+
+Tile = Tuple[int, int, int, int]
+
+
+def _axis_starts(length: int, tile_size: int, overlap: int) -> List[int]:
+    if length <= tile_size:
+        return [0]
+    stride = tile_size - overlap
+    count = math.ceil((length - overlap) / stride)
+    # Spread tiles evenly from edge to edge; neighbours overlap by at least `overlap`
+    span = length - tile_size
+    return [round(i * span / (count - 1)) for i in range(count)]
+
+
+def compute_tiles(width: int, height: int, tile_size: int, overlap: int = 0) -> List[Tile]:
+    """Return (left, top, right, bottom) boxes covering the image in row-major order"""
+    if not 0 <= overlap < tile_size:
+        raise ValueError(f"Tile overlap must be in [0, tile_size): got overlap={overlap}, tile_size={tile_size}")
+    return [
+        (left, top, min(left + tile_size, width), min(top + tile_size, height))
+        for top in _axis_starts(height, tile_size, overlap)
+        for left in _axis_starts(width, tile_size, overlap)
+    ]
+
+
+def offset_detections(detections: List[Detection], left: int, top: int) -> List[Detection]:
+    """Translate tile-local detections into full-image coordinates"""
+    return [
+        Detection(
+            class_id=d.class_id,
+            class_name=d.class_name,
+            confidence=d.confidence,
+            bbox=BoundingBox(
+                x1=d.bbox.x1 + left,
+                y1=d.bbox.y1 + top,
+                x2=d.bbox.x2 + left,
+                y2=d.bbox.y2 + top,
+            ),
+        )
+        for d in detections
+    ]
+
+
+def _intersection(a: BoundingBox, b: BoundingBox) -> float:
+    inter_w = min(a.x2, b.x2) - max(a.x1, b.x1)
+    inter_h = min(a.y2, b.y2) - max(a.y1, b.y1)
+    if inter_w <= 0 or inter_h <= 0:
+        return 0.0
+    return inter_w * inter_h
+
+
+def _area(box: BoundingBox) -> float:
+    return (box.x2 - box.x1) * (box.y2 - box.y1)
+
+
+def _iou(a: BoundingBox, b: BoundingBox) -> float:
+    intersection = _intersection(a, b)
+    union = _area(a) + _area(b) - intersection
+    return intersection / union if union > 0 else 0.0
+
+
+def _ios(a: BoundingBox, b: BoundingBox) -> float:
+    """Intersection over the smaller box, which stays high for boxes cut off at a seam"""
+    smaller = min(_area(a), _area(b))
+    return _intersection(a, b) / smaller if smaller > 0 else 0.0
+
+
+def _union_box(a: BoundingBox, b: BoundingBox) -> BoundingBox:
+    return BoundingBox(
+        x1=min(a.x1, b.x1),
+        y1=min(a.y1, b.y1),
+        x2=max(a.x2, b.x2),
+        y2=max(a.y2, b.y2),
+    )
+
+
+def merge_detections(
+    tile_detections: Sequence[List[Detection]],
+    iou_threshold: float = 0.5,
+    ios_threshold: float = 0.5,
+) -> List[Detection]:
+    """Deduplicate detections from overlapping tiles.
+
+    Within a tile this is class-aware greedy NMS on IoU. An object that crosses
+    a seam is seen truncated by each tile, so boxes from different tiles are
+    matched on intersection over the smaller box and joined into one box.
+    """
+    candidates = sorted(
+        (
+            (detection, tile_index)
+            for tile_index, detections in enumerate(tile_detections)
+            for detection in detections
+        ),
+        key=lambda candidate: candidate[0].confidence,
+        reverse=True,
+    )
+
+    kept: List[Tuple[Detection, Set[int]]] = []
+    for detection, tile_index in candidates:
+        for i, (k, tiles) in enumerate(kept):
+            if k.class_id != detection.class_id:
+                continue
+            if tile_index in tiles:
+                if _iou(k.bbox, detection.bbox) >= iou_threshold:
+                    break
+            elif _ios(k.bbox, detection.bbox) >= ios_threshold:
+                kept[i] = (
+                    Detection(
+                        class_id=k.class_id,
+                        class_name=k.class_name,
+                        confidence=k.confidence,
+                        bbox=_union_box(k.bbox, detection.bbox),
+                    ),
+                    tiles | {tile_index},
+                )
+                break
+        else:
+            kept.append((detection, {tile_index}))
+
+    return [detection for detection, _ in kept]
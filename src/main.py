@@ -7,9 +7,16 @@ from src.domain.entities.detection_result import ProcessingTask
 from src.infrastructure.services.task_processor import TaskProcessor
 from src.infrastructure.config import load_config
 from src.infrastructure.models.rfdetr_model import RFDETRModel
+from src.infrastructure.resource_planner import (
+    apply_resource_plan,
+    plan_resources,
+    read_resource_limits,
+)
+from src.infrastructure.repositories.cached_image_repository import CachedImageRepository
 from src.infrastructure.repositories.gcs_image_repository import GCSImageRepository
 from src.infrastructure.repositories.pubsub_task_processor import PubSubTaskProcessor
 from src.infrastructure.services.internal_api_callback_service import InternalAPICallbackService
+from src.infrastructure.services.pubsub_result_publisher import PubSubResultPublisher
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -21,24 +28,60 @@ class ObjectDetectionWorker:
         self._setup_dependencies()
 
     def _setup_dependencies(self):
+        plan = plan_resources(
+            read_resource_limits(),
+            inference_threads=self._config.inference_threads,
+            interop_threads=self._config.interop_threads,
+            io_workers=self._config.io_workers,
+            pin_inference_cpus=self._config.pin_inference_cpus,
+        )
+        apply_resource_plan(plan)
+
         gcs_client = storage.Client(project=self._config.gcp_project_id)
         
-        detection_model = RFDETRModel(self._config.confidence_threshold)
-        image_repository = GCSImageRepository(gcs_client, self._config.gcs_bucket)
+        detection_model = RFDETRModel(
+            self._config.confidence_threshold,
+            inference_cpus=plan.inference_cpus,
+        )
+        image_repository = GCSImageRepository(
+            gcs_client,
+            self._config.gcs_bucket,
+            io_workers=plan.io_workers,
+            decode_workers=plan.decode_workers,
+        )
+        if self._config.image_cache_dir:
+            image_repository = CachedImageRepository(
+                image_repository,
+                self._config.image_cache_dir,
+                self._config.image_cache_max_bytes,
+                decode_workers=plan.decode_workers,
+            )
         callback_service = InternalAPICallbackService(
             self._config.api_service_url,
             self._config.callback_timeout
         )
+        result_publisher = None
+        if self._config.pubsub_results_topic:
+            result_publisher = PubSubResultPublisher(
+                self._config.gcp_project_id,
+                self._config.pubsub_results_topic,
+                self._config.results_publish_timeout,
+            )
         
         self._task_processor = TaskProcessor(
             detection_model,
             image_repository,
             callback_service,
+            result_publisher=result_publisher,
+            tile_size=self._config.tile_size,
+            tile_overlap=self._config.tile_overlap,
         )
         
         self._pubsub_processor = PubSubTaskProcessor(
             self._config.gcp_project_id,
-            self._config.pubsub_subscription
+            self._config.pubsub_subscription,
+            max_messages=plan.max_messages,
+            max_bytes=plan.max_bytes,
         )
 
     def _handle_task(self, task: ProcessingTask):
@@ -1,8 +1,12 @@
 from datetime import datetime
 from uuid import uuid4
 
-from src.domain.entities.serializers import serialize_processing_result
+from src.domain.entities.serializers import (
+    serialize_partial_result,
+    serialize_processing_result,
+)
 from src.domain.entities.detection_result import (
+    PartialResult,
     ProcessingResult,
     Detection,
     BoundingBox,
@@ -70,3 +74,21 @@ def test_serialize_multiple_detections():
     assert len(serialized["detections"]) == 2
     assert serialized["detections"][0]["class_name"] == "person"
     assert serialized["detections"][1]["class_name"] == "car"
+
+
+def test_serialize_partial_result():
+    """Test serialization of a streamed tile result"""
+    task_id = uuid4()
+    partial = PartialResult(
+        task_id=task_id,
+        detections=[Detection(1, "person", 0.95, BoundingBox(10.0, 20.0, 100.0, 200.0))],
+        chunk_index=2,
+        total_chunks=4,
+    )
+    
+    serialized = serialize_partial_result(partial)
+    
+    assert serialized["task_id"] == str(task_id)
+    assert serialized["chunk_index"] == 2
+    assert serialized["total_chunks"] == 4
+    assert serialized["detections"][0]["bbox"]["y2"] == 200.0
@@ -0,0 +1,221 @@
+import asyncio
+import multiprocessing
+import os
+
+import pytest
+from PIL import Image
+
+from src.infrastructure.repositories.cached_image_repository import CachedImageRepository
+from src.infrastructure.repositories.local_image_repository import LocalImageRepository
+
+
+def _write_png(path, color, size=(16, 16)):
+    Image.new("RGB", size, color).save(path, format="PNG")
+
+
+def _key_dirs(cache_dir):
+    return [name for name in os.listdir(cache_dir) if not name.startswith(".")]
+
+
+def _cache_entries(cache_dir):
+    return [
+        os.path.join(key_dir, name)
+        for key_dir in _key_dirs(cache_dir)
+        for name in os.listdir(os.path.join(cache_dir, key_dir))
+    ]
+
+
+def _retrieve_all(source, cache_dir, max_bytes, keys, results):
+    cache = CachedImageRepository(LocalImageRepository(str(source)), str(cache_dir), max_bytes)
+    
+    async def run():
+        for key in keys:
+            image = await cache.retrieve_image(key)
+            results.put((key, image.getpixel((0, 0))))
+    
+    asyncio.run(run())
+
+
+@pytest.fixture
+def source(tmp_path):
+    images = tmp_path / "images"
+    images.mkdir()
+    _write_png(images / "a.png", (255, 0, 0))
+    _write_png(images / "b.png", (0, 255, 0))
+    return images
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_download(source, tmp_path):
+    """Test that a second retrieval is served from disk without re-reading the source"""
+    repo = LocalImageRepository(str(source))
+    cache = CachedImageRepository(repo, str(tmp_path / "cache"), max_bytes=1024 * 1024)
+    
+    first = await cache.retrieve_image("a.png")
+    
+    calls = []
+    original = repo.retrieve_image_bytes
+    
+    async def tracking(key):
+        calls.append(key)
+        return await original(key)
+    
+    repo.retrieve_image_bytes = tracking
+    second = await cache.retrieve_image("a.png")
+    
+    assert calls == []
+    assert second.getpixel((0, 0)) == first.getpixel((0, 0)) == (255, 0, 0)
+    assert len(_cache_entries(tmp_path / "cache")) == 1
+
+
+@pytest.mark.asyncio
+async def test_changed_source_invalidates_entry(source, tmp_path):
+    """Test that a new object version is fetched instead of the stale cached copy"""
+    cache = CachedImageRepository(
+        LocalImageRepository(str(source)), str(tmp_path / "cache"), max_bytes=1024 * 1024
+    )
+    await cache.retrieve_image("a.png")
+    
+    _write_png(source / "a.png", (0, 0, 255), size=(20, 20))
+    image = await cache.retrieve_image("a.png")
+    
+    assert image.getpixel((0, 0)) == (0, 0, 255)
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used(source, tmp_path):
+    """Test that the oldest entry is evicted once the size bound is exceeded"""
+    cache_dir = tmp_path / "cache"
+    entry_size = os.path.getsize(source / "a.png")
+    cache = CachedImageRepository(
+        LocalImageRepository(str(source)), str(cache_dir), max_bytes=entry_size + 1
+    )
+    
+    await cache.retrieve_image("a.png")
+    (entry,) = _cache_entries(cache_dir)
+    os.utime(cache_dir / entry, (0, 0))
+    await cache.retrieve_image("b.png")
+    
+    entries = _cache_entries(cache_dir)
+    assert len(entries) == 1
+    assert entries != [entry]
+
+
+@pytest.mark.asyncio
+async def test_corrupt_entry_is_refetched(source, tmp_path):
+    """Test that an unreadable cache file is discarded and the image re-downloaded"""
+    cache_dir = tmp_path / "cache"
+    cache = CachedImageRepository(
+        LocalImageRepository(str(source)), str(cache_dir), max_bytes=1024 * 1024
+    )
+    await cache.retrieve_image("a.png")
+    (entry,) = _cache_entries(cache_dir)
+    (cache_dir / entry).write_bytes(b"not an image")
+    
+    image = await cache.retrieve_image("a.png")
+    
+    assert image.getpixel((0, 0)) == (255, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_missing_image_raises(source, tmp_path):
+    """Test that missing source images surface the repository error"""
+    cache = CachedImageRepository(
+        LocalImageRepository(str(source)), str(tmp_path / "cache"), max_bytes=1024 * 1024
+    )
+    
+    with pytest.raises(RuntimeError, match="Image not found"):
+        await cache.retrieve_image("missing.png")
+
+
+@pytest.mark.asyncio
+async def test_first_fetch_skips_metadata_check(source, tmp_path):
+    """Test that an uncached key is downloaded without a separate metadata request"""
+    repo = LocalImageRepository(str(source))
+    cache = CachedImageRepository(repo, str(tmp_path / "cache"), max_bytes=1024 * 1024)
+    
+    calls = []
+    original = repo.get_image_id
+    
+    async def tracking(key):
+        calls.append(key)
+        return await original(key)
+    
+    repo.get_image_id = tracking
+    await cache.retrieve_image("a.png")
+    assert calls == []
+    
+    await cache.retrieve_image("a.png")
+    assert calls == ["a.png"]
+
+
+@pytest.mark.asyncio
+async def test_hit_survives_eviction_after_decode(source, tmp_path, monkeypatch):
+    """Test that an entry evicted right after decoding still serves the decoded image"""
+    repo = LocalImageRepository(str(source))
+    cache = CachedImageRepository(repo, str(tmp_path / "cache"), max_bytes=1024 * 1024)
+    await cache.retrieve_image("a.png")
+    
+    def evicted(path, *args, **kwargs):
+        raise FileNotFoundError(path)
+    
+    monkeypatch.setattr(os, "utime", evicted)
+    
+    async def unexpected_download(key):
+        raise AssertionError("cache hit was re-downloaded")
+    
+    repo.retrieve_image_bytes = unexpected_download
+    image = await cache.retrieve_image("a.png")
+    
+    assert image.getpixel((0, 0)) == (255, 0, 0)
+
+
+def test_processes_share_cache_directory(tmp_path):
+    """Test two processes writing and evicting in one cache directory concurrently"""
+    source = tmp_path / "images"
+    source.mkdir()
+    colors = {f"{i}.png": (i * 20, 255 - i * 20, 0) for i in range(12)}
+    for key, color in colors.items():
+        _write_png(source / key, color)
+    
+    cache_dir = tmp_path / "cache"
+    max_bytes = 4 * os.path.getsize(source / "0.png")
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    keys = list(colors)
+    workers = [
+        context.Process(target=_retrieve_all, args=(source, cache_dir, max_bytes, order, results))
+        for order in (keys, keys[::-1])
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+    
+    assert all(worker.exitcode == 0 for worker in workers)
+    retrieved = [results.get(timeout=5) for _ in range(2 * len(keys))]
+    assert all(pixel == colors[key] for key, pixel in retrieved)
+    
+    entries = _cache_entries(cache_dir)
+    assert sum(os.path.getsize(cache_dir / name) for name in entries) <= max_bytes
+    assert not [name for name in os.listdir(cache_dir) if name.startswith(".tmp-")]
+    assert len(_key_dirs(cache_dir)) == len(entries)
+
+
+@pytest.mark.asyncio
+async def test_bytes_api_is_served_from_cache(source, tmp_path):
+    """Test that retrieve_image_bytes through the wrapper reads cached bytes"""
+    repo = LocalImageRepository(str(source))
+    cache = CachedImageRepository(repo, str(tmp_path / "cache"), max_bytes=1024 * 1024)
+    first_data, first_id = await cache.retrieve_image_bytes("a.png")
+    
+    async def unexpected_download(key):
+        raise AssertionError("cached bytes were re-downloaded")
+    
+    repo.retrieve_image_bytes = unexpected_download
+    data, image_id = await cache.retrieve_image_bytes("a.png")
+    image = await cache.retrieve_image("a.png")
+    
+    assert (data, image_id) == (first_data, first_id)
+    assert data == (source / "a.png").read_bytes()
+    assert image.getpixel((0, 0)) == (255, 0, 0)
@@ -3,6 +3,9 @@ from unittest.mock import Mock, AsyncMock
 from datetime import datetime
 from uuid import uuid4
 
+from PIL import Image
+
+from src.domain.repositories.result_publisher import ResultPublisher
 from src.infrastructure.services.task_processor import TaskProcessor
 from src.domain.entities.detection_result import (
     ProcessingTask,
@@ -72,3 +75,81 @@ async def test_empty_detections(mocks):
     
     assert len(result.detections) == 0
     assert result.processing_time_ms >= 0
+
+
+class StubResultPublisher(ResultPublisher):
+    """Local sink that records streamed messages in publish order"""
+
+    def __init__(self):
+        self.messages = []
+
+    async def publish_partial(self, partial):
+        self.messages.append(("partial", partial))
+
+    async def publish_final(self, result):
+        self.messages.append(("final", result))
+
+
+@pytest.mark.asyncio
+async def test_streams_partial_results_per_tile(mocks):
+    """Test tiled processing emits one partial per tile, then the merged final"""
+    _, model, repo, callback = mocks
+    repo.retrieve_image = AsyncMock(return_value=Image.new("RGB", (200, 100)))
+    model.predict.side_effect = lambda tile: [Detection(
+        class_id=1, class_name="person", confidence=0.9,
+        bbox=BoundingBox(x1=0.0, y1=0.0, x2=50.0, y2=50.0)
+    )] if tile.size == (100, 100) else []
+    publisher = StubResultPublisher()
+    processor = TaskProcessor(
+        model, repo, callback,
+        result_publisher=publisher, tile_size=100, tile_overlap=0,
+    )
+    
+    task = ProcessingTask(task_id=uuid4(), image_path="large.jpg")
+    result = await processor.process_task(task)
+    
+    kinds = [kind for kind, _ in publisher.messages]
+    assert kinds == ["partial", "partial", "final"]
+    
+    second = publisher.messages[1][1]
+    assert (second.chunk_index, second.total_chunks) == (1, 2)
+    assert second.detections[0].bbox.x1 == 100.0
+    
+    assert publisher.messages[-1][1] is result
+    assert len(result.detections) == 2
+
+
+@pytest.mark.asyncio
+async def test_final_result_deduplicates_overlapping_tiles(mocks):
+    """Test an object seen by two overlapping tiles appears once in the final result"""
+    _, model, repo, callback = mocks
+    repo.retrieve_image = AsyncMock(return_value=Image.new("RGB", (150, 100)))
+    # Tiles start at x=0 and x=50; both see the object at image x 60..90
+    tile_boxes = iter([(60.0, 90.0, 0.8), (10.0, 40.0, 0.9)])
+    
+    def predict(tile):
+        x1, x2, confidence = next(tile_boxes)
+        return [Detection(2, "car", confidence, BoundingBox(x1, 10.0, x2, 40.0))]
+    
+    model.predict.side_effect = predict
+    publisher = StubResultPublisher()
+    processor = TaskProcessor(
+        model, repo, callback,
+        result_publisher=publisher, tile_size=100, tile_overlap=50,
+    )
+    
+    result = await processor.process_task(ProcessingTask(task_id=uuid4(), image_path="x.jpg"))
+    
+    assert len(result.detections) == 1
+    assert result.detections[0].confidence == 0.9
+    partials = [p for kind, p in publisher.messages if kind == "partial"]
+    assert sum(len(p.detections) for p in partials) == 2
+
+
+@pytest.mark.parametrize("tile_size,tile_overlap", [(64, 64), (100, -50)])
+def test_rejects_invalid_tile_overlap(mocks, tile_size, tile_overlap):
+    """Test that overlap must be non-negative and smaller than the tile"""
+    _, model, repo, callback = mocks
+    
+    with pytest.raises(ValueError, match="Tile overlap"):
+        TaskProcessor(model, repo, callback, tile_size=tile_size, tile_overlap=tile_overlap)
@@ -0,0 +1,91 @@
+import pytest
+
+from src.domain.entities.detection_result import BoundingBox, Detection
+from src.infrastructure.services.tiling import (
+    compute_tiles,
+    merge_detections,
+    offset_detections,
+)
+
+
+def test_small_image_is_single_tile():
+    """Test that images within the tile size are not split"""
+    assert compute_tiles(80, 60, tile_size=100, overlap=10) == [(0, 0, 80, 60)]
+
+
+def test_tiles_cover_image_with_overlap():
+    """Test that tiles overlap and the last tile is aligned to the edge"""
+    tiles = compute_tiles(250, 100, tile_size=100, overlap=20)
+    
+    assert tiles == [(0, 0, 100, 100), (75, 0, 175, 100), (150, 0, 250, 100)]
+
+
+@pytest.mark.parametrize("length,expected_starts", [
+    (1984, [0, 960]),
+    (2000, [0, 488, 976]),
+])
+def test_tile_count_avoids_near_duplicate_edge_tile(length, expected_starts):
+    """Test that tiles are spread evenly instead of snapping an extra tile to the edge"""
+    tiles = compute_tiles(length, 1024, tile_size=1024, overlap=64)
+    
+    assert [left for left, _, _, _ in tiles] == expected_starts
+
+
+def test_offset_detections():
+    """Test translating tile-local boxes to image coordinates"""
+    detection = Detection(1, "person", 0.9, BoundingBox(1.0, 2.0, 3.0, 4.0))
+    
+    moved = offset_detections([detection], left=100, top=50)[0]
+    
+    assert (moved.bbox.x1, moved.bbox.y1, moved.bbox.x2, moved.bbox.y2) == (101.0, 52.0, 103.0, 54.0)
+    assert detection.bbox.x1 == 1.0
+
+
+def test_merge_keeps_highest_confidence_per_class():
+    """Test that overlapping boxes of one class collapse but other classes survive"""
+    detections = [
+        Detection(1, "person", 0.7, BoundingBox(0.0, 0.0, 100.0, 100.0)),
+        Detection(1, "person", 0.9, BoundingBox(5.0, 5.0, 100.0, 100.0)),
+        Detection(2, "car", 0.8, BoundingBox(0.0, 0.0, 100.0, 100.0)),
+        Detection(1, "person", 0.6, BoundingBox(300.0, 300.0, 350.0, 350.0)),
+    ]
+    
+    merged = merge_detections([detections])
+    
+    assert [(d.class_name, d.confidence) for d in merged] == [
+        ("person", 0.9),
+        ("car", 0.8),
+        ("person", 0.6),
+    ]
+
+
+def test_merge_joins_object_cut_at_seam():
+    """Test that truncated boxes from neighbouring tiles become one box"""
+    # Tile 1024 with overlap 64: tiles meet in x=960..1024 and each sees part of the car
+    left_tile = [Detection(2, "car", 0.8, BoundingBox(900.0, 100.0, 1024.0, 200.0))]
+    right_tile = [Detection(2, "car", 0.9, BoundingBox(960.0, 100.0, 1100.0, 200.0))]
+    
+    merged = merge_detections([left_tile, right_tile])
+    
+    assert len(merged) == 1
+    assert merged[0].confidence == 0.9
+    box = merged[0].bbox
+    assert (box.x1, box.y1, box.x2, box.y2) == (900.0, 100.0, 1100.0, 200.0)
+    assert right_tile[0].bbox.x1 == 960.0
+
+
+def test_merge_keeps_separate_objects_within_a_tile():
+    """Test that a small box inside a larger one in the same tile is not absorbed"""
+    tile = [
+        Detection(1, "person", 0.9, BoundingBox(0.0, 0.0, 200.0, 200.0)),
+        Detection(1, "person", 0.8, BoundingBox(10.0, 10.0, 60.0, 60.0)),
+    ]
+    
+    assert len(merge_detections([tile])) == 2
+
+
+@pytest.mark.parametrize("tile_size,overlap", [(64, 64), (100, -50)])
+def test_rejects_overlap_outside_tile(tile_size, overlap):
+    """Test that overlaps that stall tiling or leave uncovered strips are rejected"""
+    with pytest.raises(ValueError, match="Tile overlap"):
+        compute_tiles(1000, 800, tile_size=tile_size, overlap=overlap)
@@ -0,0 +1,106 @@
+from src.infrastructure.resource_planner import (
+    ResourceLimits,
+    plan_resources,
+    read_resource_limits,
+)
+
+GiB = 1024 * 1024 * 1024
+
+
+def test_reads_cgroup_v2_limits(tmp_path):
+    """Test CPU quota and memory limit parsing from cgroup v2 files"""
+    (tmp_path / "cpu.max").write_text("100000 100000\n")
+    (tmp_path / "memory.max").write_text(f"{4 * GiB}\n")
+
+    limits = read_resource_limits(str(tmp_path))
+
+    assert limits.cpu_quota == min(1.0, len(limits.available_cpus))
+    assert limits.cgroup_cpu_quota == 1.0
+    assert limits.memory_limit_bytes == 4 * GiB
+
+
+def test_reads_cgroup_v1_limits(tmp_path):
+    """Test fallback to cgroup v1 quota and period files"""
+    (tmp_path / "cpu").mkdir()
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("50000\n")
+    (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+    (tmp_path / "memory").mkdir()
+    (tmp_path / "memory" / "memory.limit_in_bytes").write_text("9223372036854771712\n")
+
+    limits = read_resource_limits(str(tmp_path))
+
+    assert limits.cpu_quota == 0.5
+    assert limits.memory_limit_bytes is None
+
+
+def test_unlimited_falls_back_to_available_cpus(tmp_path):
+    """Test that an unlimited quota uses the CPUs the process may run on"""
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+
+    limits = read_resource_limits(str(tmp_path))
+
+    assert limits.cpu_quota == float(len(limits.available_cpus))
+
+
+def test_plan_for_deployment_limits():
+    """Test the plan for the 1 CPU / 4Gi limits in k8s/deployment.yaml"""
+    limits = ResourceLimits(cpu_quota=1.0, memory_limit_bytes=4 * GiB, available_cpus=(0, 1, 2, 3))
+
+    plan = plan_resources(limits)
+
+    assert plan.inference_threads == 1
+    assert plan.interop_threads == 1
+    assert plan.decode_workers == 1
+    assert plan.io_workers == 2
+    assert plan.max_messages == 1
+    assert plan.inference_cpus is None
+
+
+def test_plan_reserves_core_and_pins_on_exclusive_cpuset():
+    """Test that larger quotas leave a core free and pin inference within an exclusive cpuset"""
+    limits = ResourceLimits(
+        cpu_quota=4.0, memory_limit_bytes=None, available_cpus=(4, 5, 6, 7), cgroup_cpu_quota=4.0
+    )
+
+    plan = plan_resources(limits, pin_inference_cpus=True)
+
+    assert plan.inference_threads == 3
+    assert plan.interop_threads == 2
+    assert plan.io_workers == 8
+    assert plan.inference_cpus == (4, 5, 6)
+
+
+def test_plan_does_not_pin_on_shared_cpuset(caplog):
+    """Test that a Burstable pod seeing the whole node is left unpinned"""
+    limits = ResourceLimits(
+        cpu_quota=1.0, memory_limit_bytes=4 * GiB, available_cpus=tuple(range(16)), cgroup_cpu_quota=1.0
+    )
+
+    plan = plan_resources(limits, pin_inference_cpus=True)
+
+    assert plan.inference_cpus is None
+    assert "Not pinning inference" in caplog.text
+
+
+def test_plan_does_not_pin_without_cpu_quota(tmp_path, caplog):
+    """Test that a pod with no CPU limit is left unpinned even though the quota falls back to all CPUs"""
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+    limits = read_resource_limits(str(tmp_path))
+
+    plan = plan_resources(limits, pin_inference_cpus=True)
+
+    assert limits.cgroup_cpu_quota is None
+    assert plan.inference_cpus is None
+    assert "no CPU quota" in caplog.text
+
+
+def test_plan_overrides_and_memory_cap():
+    """Test explicit overrides and memory-bounded in-flight messages"""
+    limits = ResourceLimits(cpu_quota=8.0, memory_limit_bytes=2 * GiB, available_cpus=tuple(range(8)))
+
+    plan = plan_resources(limits, inference_threads=2, interop_threads=4, io_workers=3)
+
+    assert plan.inference_threads == 2
+    assert plan.interop_threads == 4
+    assert plan.io_workers == 3
+    assert plan.max_messages == 1